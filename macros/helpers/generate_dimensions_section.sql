@@ -2,30 +2,21 @@
   {#- Generate the DIMENSIONS section -#}
   
   {%- set dims = [] -%}
-  {%- set time_granularity_mapping = {
-    'day': 'DAY',
-    'week': 'WEEK',
-    'month': 'MONTH',
-    'quarter': 'QUARTER',
-    'year': 'YEAR',
-    'hour': 'HOUR',
-    'minute': 'MINUTE'
-  } -%}
   
   {%- for dimension in dimensions -%}
-    {%- set name = dimension.name -%}
-    {%- set expr = dimension.expr or name -%}
-    {%- set description = dimension.description or '' -%}
-    {%- set dim_type = dimension.type or 'categorical' -%}
+    {%- set name = dimension['name'] -%}
+    {%- set expr = dimension['expr'] or name -%}
+    {%- set description = (dimension['description'] or '').replace("'", "''") -%}
+    {%- set dim_type = dimension['type'] or 'categorical' -%}
     
     {#- Handle time dimensions with granularity -#}
     {%- if dim_type == 'time' -%}
-      {%- set type_params = dimension.type_params or {} -%}
-      {%- set granularity = type_params.time_granularity or 'day' -%}
+      {%- set type_params = dimension['type_params'] or {} -%}
+      {%- set granularity = type_params['time_granularity'] or 'day' -%}
       {%- if expr == name and granularity -%}
         {#- If no custom expression, add DATE_TRUNC for time dimensions -#}
-        {%- set mapped_granularity = time_granularity_mapping.get(granularity, granularity.upper()) -%}
-        {%- set expr = "DATE_TRUNC('" ~ mapped_granularity ~ "', " ~ name ~ ")" -%}
+        {#- dbt granularities map to Snowflake date parts by uppercasing -#}
+        {%- set expr = "DATE_TRUNC('" ~ granularity.upper() ~ "', " ~ name ~ ")" -%}
       {%- endif -%}
     {%- endif -%}
     
@@ -33,24 +24,15 @@
     {%- set expr_str = expr | string -%}
     {%- if expr_str | length > 60 -%}
       {%- set expr_lines = dbt_semantic_view_converter.wrap_long_expression(expr_str) -%}
-      {%- set dim_definition -%}
-{{ table_alias }}.{{ name }} AS (
-{{ expr_lines }}
-)
-{%- if description %}
-  COMMENT = '{{ description }}'
-{%- endif %}
-      {%- endset -%}
+      {%- set dim_parts = [table_alias ~ '.' ~ name ~ ' AS (\n' ~ expr_lines ~ '\n)'] -%}
     {%- else -%}
-      {%- set dim_definition -%}
-{{ table_alias }}.{{ name }} AS {{ expr }}
-{%- if description %}
-  COMMENT = '{{ description }}'
-{%- endif %}
-      {%- endset -%}
+      {%- set dim_parts = [table_alias ~ '.' ~ name ~ ' AS ' ~ expr] -%}
+    {%- endif -%}
+    {%- if description -%}
+      {%- do dim_parts.append("\n  COMMENT = '" ~ description ~ "'") -%}
     {%- endif -%}
     
-    {%- do dims.append(dim_definition) -%}
+    {%- do dims.append(dim_parts | join('')) -%}
   {%- endfor -%}
   
   {%- if dims -%}
@@ -0,0 +1,62 @@
+{% macro generate_measures_sections(table_alias, measures) %}
+  {#- Generate the FACTS and METRICS sections in a single pass over measures -#}
+  
+  {%- set facts = [] -%}
+  {%- set metrics = [] -%}
+  {%- set aggregation_mapping = {
+    'sum': 'SUM',
+    'avg': 'AVG',
+    'average': 'AVG',
+    'count': 'COUNT',
+    'count_distinct': 'COUNT',
+    'min': 'MIN',
+    'max': 'MAX',
+    'median': 'MEDIAN',
+    'percentile': 'PERCENTILE_CONT',
+    'sum_boolean': 'SUM'
+  } -%}
+  
+  {%- for measure in measures -%}
+    {%- set name = measure['name'] -%}
+    {%- set expr = measure['expr'] or name -%}
+    {%- set description = (measure['description'] or '').replace("'", "''") -%}
+    {%- set agg = measure['agg'] or 'sum' -%}
+    {%- set agg_lower = agg.lower() -%}
+    {%- set expr_str = expr | string -%}
+    
+    {#- Only include as facts if they represent row-level data -#}
+    {#- Skip measures that are clearly aggregations for the metrics section -#}
+    {%- if expr_str != '1' and agg_lower not in ['count', 'count_distinct'] and expr_str[:5].upper() != 'COUNT' -%}
+      {%- set fact_parts = [table_alias ~ '.' ~ name ~ ' AS ' ~ expr] -%}
+      {%- if description -%}
+        {%- do fact_parts.append("\n  COMMENT = '" ~ description ~ "'") -%}
+      {%- endif -%}
+      {%- do facts.append(fact_parts | join('')) -%}
+    {%- endif -%}
+    
+    {#- Map dbt aggregation to Snowflake -#}
+    {%- set snowflake_agg = aggregation_mapping.get(agg_lower) or agg.upper() -%}
+    
+    {#- Handle special cases -#}
+    {%- if agg_lower == 'count_distinct' -%}
+      {%- set metric_expr = 'COUNT(DISTINCT ' ~ expr ~ ')' -%}
+    {%- elif expr_str == '1' and agg_lower in ['sum', 'count'] -%}
+      {#- Handle count metrics like dbt's "expr: 1, agg: sum" -#}
+      {%- set metric_expr = 'COUNT(*)' -%}
+    {%- else -%}
+      {%- set metric_expr = snowflake_agg ~ '(' ~ expr ~ ')' -%}
+    {%- endif -%}
+    
+    {#- Generate cleaner metric names -#}
+    {%- set metric_name = dbt_semantic_view_converter.generate_metric_name(name, agg_lower) -%}
+    
+    {%- set metric_parts = [table_alias ~ '.' ~ metric_name ~ ' AS ' ~ metric_expr] -%}
+    {%- if description -%}
+      {%- do metric_parts.append("\n  COMMENT = '" ~ description ~ "'") -%}
+    {%- endif -%}
+    {%- do metrics.append(metric_parts | join('')) -%}
+  {%- endfor -%}
+  
+  {{ return((facts | join(',\n'), metrics | join(',\n'))) }}
+
+{% endmacro %}
@@ -1,33 +1,13 @@
-{% macro generate_tables_section(semantic_model_name, table_name, entities) %}
+{% macro generate_tables_section(semantic_model_name, table_name, entities, primary_key=none) %}
   {#- Generate the TABLES section of the semantic view -#}
   
-  {%- set primary_key = none -%}
-  
-  {#- Find primary entity -#}
-  {%- for entity in entities -%}
-    {%- if entity.type == 'primary' -%}
-      {%- set primary_key = entity.expr or entity.name -%}
-      {%- break -%}
-    {%- endif -%}
-  {%- endfor -%}
-  
   {%- if not primary_key -%}
-    {#- If no primary key found, use first entity or default -#}
-    {%- if entities -%}
-      {%- set first_entity = entities[0] -%}
-      {%- set primary_key = first_entity.expr or first_entity.name or 'id' -%}
-    {%- else -%}
-      {%- set primary_key = 'id' -%}
-    {%- endif -%}
+    {%- set primary_key = dbt_semantic_view_converter.resolve_entities(entities)[0] -%}
   {%- endif -%}
   
   {%- set table_alias = semantic_model_name -%}
+  {%- set table_parts = [table_alias, ' AS ', table_name, '\n  PRIMARY KEY (', primary_key, ')'] -%}
 
-{%- set result -%}
-{{ table_alias }} AS {{ table_name }}
-  PRIMARY KEY ({{ primary_key }})
-{%- endset -%}
-
-{{ return(result) }}
+  {{ return(table_parts | join('')) }}
 
-{% endmacro %} 
\ No newline at end of file
+{% endmacro %}
@@ -0,0 +1,29 @@
+{% macro resolve_entities(entities) %}
+  {#- Find the primary key and build the RELATIONSHIPS section in a single pass over entities -#}
+  
+  {%- set ns = namespace(primary_entity=none) -%}
+  {%- set relationships = [] -%}
+  
+  {%- for entity in entities -%}
+    {%- if entity['type'] == 'primary' and ns.primary_entity is none -%}
+      {%- set ns.primary_entity = entity -%}
+    {%- elif entity['type'] == 'foreign' -%}
+      {%- set entity_name = entity['name'] -%}
+      {%- set expr = entity['expr'] or entity_name -%}
+      
+      {#- Create a relationship name and infer target table -#}
+      {%- set relationship_name = 'to_' ~ entity_name -%}
+      {%- set target_table = entity_name.replace('_id', '').replace('id', '') or 'unknown' -%}
+      
+      {%- set relationship_parts = [relationship_name, ' AS\n  semantic_model (', expr, ') REFERENCES ', target_table] -%}
+      {%- do relationships.append(relationship_parts | join('')) -%}
+    {%- endif -%}
+  {%- endfor -%}
+  
+  {#- If no primary entity found, use first entity or default -#}
+  {%- set key_entity = ns.primary_entity or (entities[0] if entities else none) -%}
+  {%- set primary_key = ((key_entity['expr'] or key_entity['name']) if key_entity else none) or 'id' -%}
+  
+  {{ return((primary_key, relationships | join(',\n'))) }}
+
+{% endmacro %}
@@ -1,15 +1,17 @@
 {% macro wrap_long_expression(expr) %}
   {#- Wrap long expressions for better readability -#}
   
-  {%- set expr_lower = expr.lower() -%}
-  
   {#- Format case statements nicely -#}
-  {%- if 'case ' in expr_lower -%}
-    {%- set formatted_expr = expr -%}
-    {%- set formatted_expr = formatted_expr | regex_replace('\\s+when\\s+', '\\n      WHEN ', ignorecase=true) -%}
-    {%- set formatted_expr = formatted_expr | regex_replace('\\s+then\\s+', ' THEN ', ignorecase=true) -%}
-    {%- set formatted_expr = formatted_expr | regex_replace('\\s+else\\s+', '\\n      ELSE ', ignorecase=true) -%}
-    {%- set formatted_expr = formatted_expr | regex_replace('\\s+end\\s*', '\\n      END', ignorecase=true) -%}
+  {%- if modules.re.search('\\bcase\\b', expr, modules.re.IGNORECASE) -%}
+    {#- dbt has no regex_replace filter; use compiled patterns from modules.re -#}
+    {%- set when_re = modules.re.compile('\\s+when\\s+', modules.re.IGNORECASE) -%}
+    {%- set then_re = modules.re.compile('\\s+then\\s+', modules.re.IGNORECASE) -%}
+    {%- set else_re = modules.re.compile('\\s+else\\s+', modules.re.IGNORECASE) -%}
+    {%- set end_re = modules.re.compile('\\s+end\\s*', modules.re.IGNORECASE) -%}
+    {%- set formatted_expr = when_re.sub('\\n      WHEN ', expr) -%}
+    {%- set formatted_expr = then_re.sub(' THEN ', formatted_expr) -%}
+    {%- set formatted_expr = else_re.sub('\\n      ELSE ', formatted_expr) -%}
+    {%- set formatted_expr = end_re.sub('\\n      END', formatted_expr) -%}
     {{ return('    ' ~ formatted_expr) }}
   {%- else -%}
     {#- Simple line wrapping for other long expressions -#}
@@ -19,22 +21,18 @@
 {% endmacro %}
 
 
-{% macro generate_metric_name(measure_name, agg) %}
-  {#- Generate a clean metric name based on measure name and aggregation -#}
-  
-  {%- set agg_lower = agg.lower() -%}
+{% macro generate_metric_name(measure_name, agg_lower) %}
+  {#- Generate a clean metric name based on measure name and lowercased aggregation -#}
   
   {#- Common patterns for cleaner names -#}
   {%- if agg_lower == 'sum' -%}
     {%- if measure_name.endswith('_count') or measure_name == 'count' -%}
       {{ return('total_count') }}
-    {%- elif measure_name.endswith('_total') or measure_name.endswith('_amount') or measure_name.endswith('_value') -%}
+    {%- elif measure_name.endswith(('_total', '_amount', '_value')) -%}
       {{ return(measure_name) }}  {#- Already descriptive -#}
     {%- else -%}
       {{ return('total_' ~ measure_name) }}
     {%- endif -%}
-  {%- elif agg_lower == 'avg' or agg_lower == 'average' -%}
-    {{ return('avg_' ~ measure_name) }}
   {%- elif agg_lower == 'count' -%}
     {%- if not measure_name.endswith('_count') -%}
       {{ return(measure_name ~ '_count') }}
@@ -47,10 +45,10 @@
     {%- else -%}
       {{ return(measure_name) }}
     {%- endif -%}
-  {%- elif agg_lower in ['min', 'max'] -%}
-    {{ return(agg_lower ~ '_' ~ measure_name) }}
   {%- else -%}
-    {{ return(agg_lower ~ '_' ~ measure_name) }}
+    {#- avg, min, max and others are prefixed with the aggregation name -#}
+    {%- set metric_prefixes = {'average': 'avg'} -%}
+    {{ return(metric_prefixes.get(agg_lower, agg_lower) ~ '_' ~ measure_name) }}
   {%- endif -%}
 
 {% endmacro %} 
\ No newline at end of file